@@ -5,4 +5,5 @@ from flask_rebar.swagger_generation.swagger_objects import Tag
 from flask_rebar.swagger_generation.swagger_objects import Server
 from flask_rebar.swagger_generation.swagger_objects import ServerVariable
 from flask_rebar.swagger_generation.marshmallow_to_swagger import sets_swagger_attr
+from flask_rebar.swagger_generation.marshmallow_to_swagger import sets_swagger_attrs
 from flask_rebar.swagger_generation.marshmallow_to_swagger import ConverterRegistry
@@ -9,23 +9,24 @@
     :license: MIT, see LICENSE for details.
 """
 import copy
-import inspect
 import logging
 import sys
-from collections import namedtuple
+import weakref
+from dataclasses import dataclass
 from typing import (
-    overload,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generic,
     Iterable,
     List,
-    Optional,
+    NamedTuple,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from typing_extensions import ParamSpec
 import marshmallow as m
@@ -49,6 +50,7 @@ TField = TypeVar("TField", bound=m.fields.Field)
 # for type hinting decorators
 S = TypeVar("S")
 P = ParamSpec("P")
+C = TypeVar("C", bound=Type["MarshmallowConverter"])
 
 LoadDumpOptions = None
 try:
@@ -60,6 +62,22 @@ except AttributeError:
         EnumField = None
 
 
+# Marshmallow constants we check against for every field/schema converted
+_MISSING = m.missing
+_RAISE = m.RAISE
+_EXCLUDE = m.EXCLUDE
+_INCLUDE = m.INCLUDE
+
+# Swagger words we check against for every validator converted
+_TYPE = sw.type_
+_ARRAY = sw.array
+_STRING = sw.string
+_MIN_ITEMS = sw.min_items
+_MAX_ITEMS = sw.max_items
+_MIN_LENGTH = sw.min_length
+_MAX_LENGTH = sw.max_length
+
+
 # Special value to signify that a JSONSchema field should be left unset
 class UNSET:
     pass
@@ -68,60 +86,32 @@ class UNSET:
 # We'll use this to mark methods as JSONSchema attribute setters
 _method_marker = "__sets_jsonschema_attr__"
 
+
 # Holds attributes that we can pass around in these recursive
 # calls to converters. Bit messy, but :shrug:
-_Context = namedtuple(
-    "_Context",
-    [
-        # This will hold a reference to a convert method that can be used
-        # to make recursive calls
-        "convert",
-        # Only really using this for validators at the moment. It will hold the
-        # JSONSchema object that's been converter so far, so that the validator
-        # can be converted based on the type of the schema.
-        "memo",
-        # The current schema being converted.
-        "schema",
-        # The major version of OpenAPI being converter for
-        "openapi_version",
-    ],
-)
+@dataclass
+class _Context:
+    # Attributes are read all the time during conversion; slots make that cheaper.
+    # (dataclass(slots=True) would do this for us, but requires Python 3.10)
+    __slots__ = ("convert", "memo", "schema", "openapi_version")
+
+    # This will hold a reference to a convert method that can be used
+    # to make recursive calls
+    convert: Callable
+    # Only really using this for validators at the moment. It will hold the
+    # JSONSchema object that's been converter so far, so that the validator
+    # can be converted based on the type of the schema.
+    memo: Dict[str, Any]
+    # The current schema being converted.
+    schema: Any
+    # The major version of OpenAPI being converter for
+    openapi_version: int
 
 
 class UnregisteredType(Exception):
     pass
 
 
-@overload
-def _normalize_validate(validate: None) -> None:
-    ...
-
-
-@overload
-def _normalize_validate(
-    validate: Union[Callable, Iterable[Callable]]
-) -> Iterable[Callable]:
-    ...
-
-
-def _normalize_validate(
-    validate: Optional[Union[Callable, Iterable[Callable]]]
-) -> Optional[Iterable[Callable]]:
-    """
-    Coerces the validate attribute on a Marshmallow field to a consistent type.
-
-    The validate attribute on a Marshmallow field can either be a single
-    Validator or a collection of Validators.
-
-    :param Validator|list[Validator] validate:
-    :rtype: list[Validator]
-    """
-    if callable(validate):
-        return [validate]
-    else:
-        return validate
-
-
 def get_swagger_title(obj: MarshmallowObject) -> str:
     """
     Gets a title for the given object. This title will be used
@@ -130,12 +120,10 @@ def get_swagger_title(obj: MarshmallowObject) -> str:
     :param obj:
     :rtype: str
     """
-    if hasattr(obj, "__swagger_title__"):
-        return obj.__swagger_title__
-    elif hasattr(obj, "__name__"):
-        return obj.__name__
-    else:
-        return obj.__class__.__name__
+    title = getattr(obj, "__swagger_title__", None)
+    if title is not None:
+        return title
+    return getattr(obj, "__name__", None) or obj.__class__.__name__
 
 
 def sets_swagger_attr(attr: str) -> Callable:
@@ -149,12 +137,15 @@ def sets_swagger_attr(attr: str) -> Callable:
             MARSHMALLOW_TYPE = String()
 
             @sets_swagger_attr('type')
-            def get_type(obj, context):
+            def get_type(self, obj, context):
                 return 'string'
 
     This converter receives instances of `String` and converts it to a
     JSONSchema object that looks like `{'type': 'string'}`.
 
+    Setters are collected once, when the converter class is created, so
+    they must be defined in the class body (or inherited).
+
     :param str attr: The attribute to set
     """
 
@@ -165,20 +156,146 @@ def sets_swagger_attr(attr: str) -> Callable:
     return wrapper
 
 
+def sets_swagger_attrs(*attrs: str) -> Callable:
+    """
+    Decorates a `MarshmallowConverter` method, marking it as a setter of
+    multiple JSONSchema attributes.
+
+    The method should return a dictionary mapping (some of) the attributes
+    to their values, which is merged into the resulting JSONSchema object.
+    Returning an attribute that wasn't declared raises a ValueError.
+    This is handy when the attributes depend on the same computation.
+
+    Example usage::
+
+        class Converter(MarshmallowConverter):
+            MARSHMALLOW_TYPE = Range
+
+            @sets_swagger_attrs('minimum', 'maximum')
+            def get_bounds(self, obj, context):
+                bounds = {'minimum': obj.min, 'maximum': obj.max}
+                return {k: v for k, v in bounds.items() if v is not None}
+
+    :param str attrs: The attributes the method may set
+    """
+
+    def wrapper(f: Callable[P, T]) -> Callable[P, T]:
+        setattr(f, _method_marker, attrs)
+        return f
+
+    return wrapper
+
+
+# Converter classes defined in this module, in order of definition
+_ALL_CONVERTERS: List[Type["MarshmallowConverter"]] = []
+
+
+def _register_converter(cls: C) -> C:
+    """
+    Decorates a `MarshmallowConverter` class defined in this module, adding it
+    to `ALL_CONVERTERS`.
+
+    :param type cls:
+    """
+    _ALL_CONVERTERS.append(cls)
+    return cls
+
+
+class _SchemaFields(NamedTuple):
+    # Tuples of the field name and the field's attribute name in schema.fields,
+    # sorted by name unless the schema is ordered, in which case declaration
+    # order is kept. Fields aren't held directly, as they refer back to their
+    # schema, which would keep it in the cache forever.
+    fields: List[Tuple[str, str]]
+    # Names of all required fields, regardless of whether the schema is partial
+    required: List[str]
+
+
+class _IdentityCache:
+    """
+    Maps objects to values by identity, without keeping the objects alive.
+
+    Schemas may define equality (e.g. by type), which would make a
+    WeakKeyDictionary hand out the entry of another, differently configured,
+    schema. Entries are dropped as soon as their object is garbage collected,
+    so a recycled id never finds a stale value.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[weakref.ref, Any]] = {}
+
+    def get(self, obj: Any) -> Any:
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0]() is obj:
+            return entry[1]
+        return None
+
+    def set(self, obj: Any, value: Any) -> None:
+        key = id(obj)
+        entries = self._entries
+
+        def discard(ref: weakref.ref) -> None:
+            entry = entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del entries[key]
+
+        entries[key] = (weakref.ref(obj, discard), value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Schema fields only depend on the schema, so we only compute these once per schema
+_schema_fields_cache = _IdentityCache()
+
+
+def _collect_schema_fields(schema: Schema) -> _SchemaFields:
+    """Collect the names and field objects for a marshmallow Schema
+
+    :param m.Schema schema:
+    :rtype: _SchemaFields
+    """
+    schema_fields = schema.fields
+    fields = [
+        (compat.get_data_key(field), name) for name, field in schema_fields.items()
+    ]
+    if not schema.ordered:
+        fields.sort()
+    return _SchemaFields(
+        fields=fields,
+        required=[prop for prop, name in fields if schema_fields[name].required],
+    )
+
+
+def _get_schema_fields(schema: Schema) -> _SchemaFields:
+    """Retrieve (and cache) the names and field objects for a marshmallow Schema
+
+    :param m.Schema schema:
+    :rtype: _SchemaFields
+    """
+    schema_fields = _schema_fields_cache.get(schema)
+    if schema_fields is None:
+        schema_fields = _collect_schema_fields(schema)
+        _schema_fields_cache.set(schema, schema_fields)
+    return schema_fields
+
+
 def get_schema_fields(schema: Schema) -> List[Tuple[str, m.fields.Field]]:
     """Retrieve all the names and field objects for a marshmallow Schema
 
+    Fields are sorted by name, unless the schema is ordered.
+
     :param m.Schema schema:
     :returns: Yields tuples of the field name and the field itself
     :rtype: typing.Iterator[typing.Tuple[str, m.fields.Field]]
     """
-    fields: List[Tuple[str, m.fields.Field]] = []
-    for name, field in schema.fields.items():
-        prop = compat.get_data_key(field)
-        fields.append((prop, field))
-    return sorted(fields)
+    schema_fields = schema.fields
+    return [
+        (prop, schema_fields[name]) for prop, name in _get_schema_fields(schema).fields
+    ]
 
 
+@_register_converter
 class MarshmallowConverter(Generic[T]):
     """
     Abstract class for objects that convert Marshmallow objects to
@@ -187,12 +304,62 @@ class MarshmallowConverter(Generic[T]):
 
     MARSHMALLOW_TYPE: Any = None
 
+    __setter_methods__: ClassVar[
+        Tuple[Tuple[Union[str, Tuple[str, ...]], Callable], ...]
+    ]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Collect the attribute setters up front so that conversion doesn't
+        # need to inspect the class on every call.
+        cls._setter_methods()
+
+    @classmethod
+    def _setter_methods(
+        cls,
+    ) -> Tuple[Tuple[Union[str, Tuple[str, ...]], Callable], ...]:
+        """
+        Gets the methods of this class that have been marked as JSONSchema
+        attribute setters.
+
+        The result is computed once per class and cached on the class.
+
+        :rtype: tuple[tuple[str|tuple[str], function]]
+        """
+        try:
+            return cls.__dict__["__setter_methods__"]
+        except KeyError:
+            pass
+
+        # Resolve methods by name the same way attribute lookup would, so
+        # that overridden methods replace the ones from base classes.
+        methods: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            methods.update(vars(klass))
+
+        setters: List[Tuple[Union[str, Tuple[str, ...]], Callable]] = []
+        for name, func in sorted(methods.items(), key=lambda item: item[0]):
+            # Pull the attribute name off the marker now, so conversion doesn't
+            # need to look it up for every setter call.
+            attr = getattr(func, _method_marker, None)
+            if attr is not None and callable(func):
+                # Attribute names are interned, as they are used as keys in
+                # every JSONSchema object this converter creates. Methods that
+                # set multiple attributes are marked with a tuple of names.
+                if isinstance(attr, tuple):
+                    setters.append((tuple(sys.intern(a) for a in attr), func))
+                else:
+                    setters.append((sys.intern(attr), func))
+
+        cls.__setter_methods__ = tuple(setters)
+        return cls.__setter_methods__
+
     def convert(self, obj: T, context: _Context) -> Dict[str, Union[str, bool]]:
         """
         Converts a Marshmallow object to a JSONSchema dictionary.
 
-        This inspects the converter instance for methods that have been
-        marked as attribute setters, calling them to set attributes on the
+        This calls the methods of the converter that have been marked as
+        attribute setters, using their results to set attributes on the
         resulting JSONSchema dictionary.
 
         :param m.Schema|m.fields.Field|Validator obj:
@@ -202,17 +369,34 @@ class MarshmallowConverter(Generic[T]):
             convert the object.
         :rtype: dict
         """
+        setters = type(self)._setter_methods()
+        if not setters:
+            return {}
+
         jsonschema_obj = {}
 
-        for _, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            if hasattr(method, _method_marker):
-                val = method(obj, context)
-                if val is not UNSET:
-                    jsonschema_obj[getattr(method, _method_marker)] = val
+        for attr, func in setters:
+            val = func(self, obj, context)
+            if val is UNSET:
+                continue
+            elif isinstance(attr, tuple):
+                merged = 0
+                for name in attr:
+                    if name in val:
+                        jsonschema_obj[name] = val[name]
+                        merged += 1
+                if merged != len(val):
+                    undeclared = ", ".join(sorted(set(val) - set(attr)))
+                    raise ValueError(
+                        f"{func.__qualname__} set undeclared attributes: {undeclared}"
+                    )
+            else:
+                jsonschema_obj[attr] = val
 
         return jsonschema_obj
 
 
+@_register_converter
 class SchemaConverter(MarshmallowConverter[Schema]):
     """Converts Marshmallow Schema objects."""
 
@@ -232,9 +416,16 @@ class SchemaConverter(MarshmallowConverter[Schema]):
         if not obj.many:
             return UNSET
 
-        singular_obj = copy.deepcopy(obj)
+        # A shallow copy is enough here, as we only need to change `many`.
+        # We don't toggle `many` on obj itself, since the schema might be in
+        # use elsewhere (e.g. serializing a response in another thread).
+        singular_obj = copy.copy(obj)
         singular_obj.many = False
 
+        # The copy has the same fields, so let it reuse the original's cache
+        # entry rather than collecting the fields for every fresh copy.
+        _schema_fields_cache.set(singular_obj, _get_schema_fields(obj))
+
         return context.convert(singular_obj, context)
 
     @sets_swagger_attr(sw.properties)
@@ -258,18 +449,13 @@ class SchemaConverter(MarshmallowConverter[Schema]):
         if obj.many or obj.partial is True:
             return UNSET
 
-        required: List[str] = []
-        obj_partial_is_collection = m.utils.is_collection(obj.partial)
+        required = _get_schema_fields(obj).required
 
-        for name, field in obj.fields.items():
-            if field.required:
-                prop = compat.get_data_key(field)
-                if obj_partial_is_collection and obj.partial and prop in obj.partial:
-                    continue
-                required.append(prop)
+        if m.utils.is_collection(obj.partial) and obj.partial:
+            required = [prop for prop in required if prop not in obj.partial]
+        else:
+            required = list(required)
 
-        if required and not obj.ordered:
-            required = sorted(required)
         return required if required else UNSET
 
     @sets_swagger_attr(sw.description)
@@ -292,9 +478,9 @@ class SchemaConverter(MarshmallowConverter[Schema]):
 
     @sets_swagger_attr(sw.additional_properties)
     def get_additional_properties(self, obj: Schema, context: _Context) -> bool:
-        if obj.unknown in (m.RAISE, m.EXCLUDE):
+        if obj.unknown in (_RAISE, _EXCLUDE):
             return False
-        elif obj.unknown is m.INCLUDE:
+        elif obj.unknown is _INCLUDE:
             return True
         else:
             raise ValueError(
@@ -302,6 +488,7 @@ class SchemaConverter(MarshmallowConverter[Schema]):
             )
 
 
+@_register_converter
 class FieldConverter(MarshmallowConverter, Generic[TField]):
     """
     Base Converter for Marshmallow Field objects.
@@ -317,27 +504,29 @@ class FieldConverter(MarshmallowConverter, Generic[TField]):
         if obj.dump_only:
             jsonschema_obj["readOnly"] = True
 
-        if obj.validate:
-            validators = _normalize_validate(obj.validate)
-            for validator in validators:
-                try:
-                    jsonschema_obj.update(
-                        context.convert(
-                            obj=validator,
-                            context=_Context(
-                                convert=context.convert,
-                                memo=jsonschema_obj,
-                                schema=context.schema,
-                                openapi_version=context.openapi_version,
-                            ),
+        validate = obj.validate
+        if validate:
+            # The validate attribute on a Marshmallow field can either be a
+            # single Validator or a collection of Validators.
+            validators = (validate,) if callable(validate) else validate
+            # Validators are converted based on the JSONSchema object converted
+            # so far, so swap it into the context while converting them.
+            outer_memo = context.memo
+            context.memo = jsonschema_obj
+            try:
+                for validator in validators:
+                    try:
+                        jsonschema_obj.update(
+                            context.convert(obj=validator, context=context)
                         )
-                    )
-                except UnregisteredType as e:
-                    logging.debug(
-                        "Unable to convert validator {validator}: {err}".format(
-                            validator=validator, err=e
+                    except UnregisteredType as e:
+                        logging.debug(
+                            "Unable to convert validator {validator}: {err}".format(
+                                validator=validator, err=e
+                            )
                         )
-                    )
+            finally:
+                context.memo = outer_memo
 
         return jsonschema_obj
 
@@ -354,7 +543,7 @@ class FieldConverter(MarshmallowConverter, Generic[TField]):
     @sets_swagger_attr(sw.default)
     def get_default(self, obj: TField, context: _Context) -> Any:
         if (
-            obj.load_default is not m.missing
+            obj.load_default is not _MISSING
             # Marshmallow accepts a callable for the default. This is tricky
             # to handle, so let's just ignore this for now.
             and not callable(obj.load_default)
@@ -380,6 +569,7 @@ class FieldConverter(MarshmallowConverter, Generic[TField]):
             return UNSET
 
 
+@_register_converter
 class ValidatorConverter(MarshmallowConverter[Validator]):
     """
     Base Converter for Marshmallow Validator objects.
@@ -390,6 +580,7 @@ class ValidatorConverter(MarshmallowConverter[Validator]):
     MARSHMALLOW_TYPE: Union[Type[Validator], Type[OneOf]] = Validator
 
 
+@_register_converter
 class NestedConverter(FieldConverter[m.fields.Nested]):
     MARSHMALLOW_TYPE = m.fields.Nested
 
@@ -397,6 +588,7 @@ class NestedConverter(FieldConverter[m.fields.Nested]):
         return context.convert(obj.schema, context)
 
 
+@_register_converter
 class ListConverter(FieldConverter[m.fields.List]):
     MARSHMALLOW_TYPE = m.fields.List
 
@@ -411,6 +603,7 @@ class ListConverter(FieldConverter[m.fields.List]):
         return context.convert(obj.inner, context)
 
 
+@_register_converter
 class DictConverter(FieldConverter[m.fields.Dict]):
     MARSHMALLOW_TYPE = m.fields.Dict
 
@@ -419,6 +612,7 @@ class DictConverter(FieldConverter[m.fields.Dict]):
         return self.null_type_determination(obj, context, sw.object_)
 
 
+@_register_converter
 class IntegerConverter(FieldConverter[m.fields.Integer]):
     MARSHMALLOW_TYPE = m.fields.Integer
 
@@ -429,6 +623,7 @@ class IntegerConverter(FieldConverter[m.fields.Integer]):
         return self.null_type_determination(obj, context, sw.integer)
 
 
+@_register_converter
 class StringConverter(FieldConverter[m.fields.String]):
     MARSHMALLOW_TYPE = m.fields.String
 
@@ -439,6 +634,7 @@ class StringConverter(FieldConverter[m.fields.String]):
         return self.null_type_determination(obj, context, sw.string)
 
 
+@_register_converter
 class NumberConverter(FieldConverter[m.fields.Number]):
     MARSHMALLOW_TYPE = m.fields.Number
 
@@ -449,6 +645,7 @@ class NumberConverter(FieldConverter[m.fields.Number]):
         return self.null_type_determination(obj, context, sw.number)
 
 
+@_register_converter
 class BooleanConverter(FieldConverter[m.fields.Boolean]):
     MARSHMALLOW_TYPE = m.fields.Boolean
 
@@ -459,6 +656,7 @@ class BooleanConverter(FieldConverter[m.fields.Boolean]):
         return self.null_type_determination(obj, context, sw.boolean)
 
 
+@_register_converter
 class DateTimeConverter(FieldConverter[m.fields.DateTime]):
     MARSHMALLOW_TYPE = m.fields.DateTime
 
@@ -473,6 +671,7 @@ class DateTimeConverter(FieldConverter[m.fields.DateTime]):
         return sw.date_time
 
 
+@_register_converter
 class UUIDConverter(FieldConverter[m.fields.UUID]):
     MARSHMALLOW_TYPE = m.fields.UUID
 
@@ -485,6 +684,7 @@ class UUIDConverter(FieldConverter[m.fields.UUID]):
         return sw.uuid
 
 
+@_register_converter
 class DateConverter(FieldConverter[m.fields.Date]):
     MARSHMALLOW_TYPE = m.fields.Date
 
@@ -497,6 +697,7 @@ class DateConverter(FieldConverter[m.fields.Date]):
         return sw.date
 
 
+@_register_converter
 class MethodConverter(FieldConverter[m.fields.Method]):
     MARSHMALLOW_TYPE = m.fields.Method
 
@@ -514,6 +715,7 @@ class MethodConverter(FieldConverter[m.fields.Method]):
             )
 
 
+@_register_converter
 class FunctionConverter(FieldConverter[m.fields.Function]):
     MARSHMALLOW_TYPE = m.fields.Function
 
@@ -531,6 +733,7 @@ class FunctionConverter(FieldConverter[m.fields.Function]):
             )
 
 
+@_register_converter
 class ConstantConverter(FieldConverter[m.fields.Constant]):
     MARSHMALLOW_TYPE = m.fields.Constant
 
@@ -539,6 +742,7 @@ class ConstantConverter(FieldConverter[m.fields.Constant]):
         return [obj.constant]
 
 
+@_register_converter
 class CsvArrayConverter(ListConverter):
     MARSHMALLOW_TYPE = CommaSeparatedList
 
@@ -561,6 +765,7 @@ class CsvArrayConverter(ListConverter):
         return False if context.openapi_version == 3 else UNSET
 
 
+@_register_converter
 class MultiArrayConverter(ListConverter):
     MARSHMALLOW_TYPE = QueryParamList
 
@@ -577,6 +782,7 @@ class MultiArrayConverter(ListConverter):
         return True if context.openapi_version == 3 else UNSET
 
 
+@_register_converter
 class RangeConverter(ValidatorConverter):
     MARSHMALLOW_TYPE = Range
 
@@ -599,6 +805,7 @@ class RangeConverter(ValidatorConverter):
             return UNSET
 
 
+@_register_converter
 class OneOfConverter(ValidatorConverter):
     MARSHMALLOW_TYPE = OneOf
 
@@ -607,44 +814,30 @@ class OneOfConverter(ValidatorConverter):
         return list(obj.choices)
 
 
+@_register_converter
 class LengthConverter(ValidatorConverter):
     MARSHMALLOW_TYPE = Length
 
-    @sets_swagger_attr(sw.min_items)
-    def get_minimum_items(
-        self, obj: Length, context: _Context
-    ) -> Union[Type[UNSET], int]:
-        if context.memo[sw.type_] == sw.array:
-            if obj.min is not None:
-                return obj.min
-        return UNSET
-
-    @sets_swagger_attr(sw.max_items)
-    def get_maximum_items(
+    # Maximums are declared first, so they precede minimums in the output,
+    # as when these were set by separate, alphabetically ordered, methods.
+    @sets_swagger_attrs(sw.max_items, sw.max_length, sw.min_items, sw.min_length)
+    def get_length_constraints(
         self, obj: Length, context: _Context
-    ) -> Union[Type[UNSET], int]:
-        if context.memo[sw.type_] == sw.array:
-            if obj.max is not None:
-                return obj.max
-        return UNSET
-
-    @sets_swagger_attr(sw.min_length)
-    def get_minimum_length(
-        self, obj: Length, context: _Context
-    ) -> Union[Type[UNSET], int]:
-        if context.memo[sw.type_] == sw.string:
-            if obj.min is not None:
-                return obj.min
-        return UNSET
-
-    @sets_swagger_attr(sw.max_length)
-    def get_maximum_length(
-        self, obj: Length, context: _Context
-    ) -> Union[Type[UNSET], int]:
-        if context.memo[sw.type_] == sw.string:
-            if obj.max is not None:
-                return obj.max
-        return UNSET
+    ) -> Union[Type[UNSET], Dict[str, int]]:
+        type_ = context.memo[_TYPE]
+        if type_ == _ARRAY:
+            min_attr, max_attr = _MIN_ITEMS, _MAX_ITEMS
+        elif type_ == _STRING:
+            min_attr, max_attr = _MIN_LENGTH, _MAX_LENGTH
+        else:
+            return UNSET
+
+        constraints = {}
+        if obj.max is not None:
+            constraints[max_attr] = obj.max
+        if obj.min is not None:
+            constraints[min_attr] = obj.min
+        return constraints
 
 
 class ConverterRegistry:
@@ -664,6 +857,11 @@ class ConverterRegistry:
         self._type_map: Dict[
             Union[Type[MarshmallowObject], Type[Authenticator]], MarshmallowConverter
         ] = {}
+        # Maps the types of converted objects to the converters resolved for them
+        self._resolved_cache: Dict[type, MarshmallowConverter] = {}
+        # Maps schemas to their conversions, keyed by the conversion parameters
+        self._schema_cache = _IdentityCache()
+        self._dispatch = self._create_dispatcher()
         # self._validator_map = {}
 
     def register_type(self, converter: MarshmallowConverter) -> None:
@@ -673,6 +871,9 @@ class ConverterRegistry:
         :param MarshmallowConverter converter:
         """
         self._type_map[converter.MARSHMALLOW_TYPE] = converter
+        # Clear in place, as the dispatcher holds on to the resolution cache
+        self._resolved_cache.clear()
+        self._schema_cache.clear()
 
     def register_types(self, converters: Iterable[MarshmallowConverter]) -> None:
         """
@@ -683,41 +884,47 @@ class ConverterRegistry:
         for converter in converters:
             self.register_type(converter)
 
-    def _get_converter_for_type(self, obj: MarshmallowObject) -> MarshmallowConverter:
+    def _resolve_converter(self, obj_type: type) -> MarshmallowConverter:
         """
-        Locates the registered converter for a given type.
-        :param obj: instance to convert
-        :return: converter for type of instance
+        Finds the registered converter for a given type, bypassing the cache.
+        :param obj_type: type of the instance to convert
+        :return: converter for the type
         """
-        method_resolution_order = obj.__class__.__mro__
-
-        for cls in method_resolution_order:
+        for cls in obj_type.__mro__:
             if cls in self._type_map:
                 return self._type_map[cls]
-        else:
-            raise UnregisteredType(
-                "No registered type found in method resolution order: {mro}\n"
-                "Registered types: {types}".format(
-                    mro=method_resolution_order, types=list(self._type_map.keys())
-                )
+
+        raise UnregisteredType(
+            "No registered type found in method resolution order: {mro}\n"
+            "Registered types: {types}".format(
+                mro=obj_type.__mro__,
+                types=", ".join(repr(t) for t in self._type_map),
             )
+        )
 
-    def _convert(
-        self, obj: MarshmallowObject, context: _Context
-    ) -> Dict[str, Union[str, bool]]:
+    def _create_dispatcher(
+        self,
+    ) -> Callable[[MarshmallowObject, _Context], Dict[str, Union[str, bool]]]:
         """
-        Converts a Marshmallow object to a JSONSchema dictionary.
-
-        :param m.Schema|m.fields.Field|Validator obj:
-            The Marshmallow object to be converted
-        :param _Context context:
-            Various information to help the converter understand how to
-            convert the given object.
+        Creates the function that converts a Marshmallow object to a JSONSchema
+        dictionary, which converters use to make recursive calls.
 
-            This helps with all the recursive nonsense.
-        :rtype: dict
+        This is the hottest path in swagger generation, so rather than a method
+        it's a closure over the resolution cache.
         """
-        return self._get_converter_for_type(obj).convert(obj=obj, context=context)
+        resolved_cache = self._resolved_cache
+        resolve_converter = self._resolve_converter
+
+        def dispatch(
+            obj: MarshmallowObject, context: _Context
+        ) -> Dict[str, Union[str, bool]]:
+            obj_type = type(obj)
+            converter = resolved_cache.get(obj_type)
+            if converter is None:
+                converter = resolved_cache[obj_type] = resolve_converter(obj_type)
+            return converter.convert(obj, context)
+
+        return dispatch
 
     def convert(
         self, obj: MarshmallowObject, openapi_version: int = 2
@@ -730,102 +937,167 @@ class ConverterRegistry:
         :param int openapi_version: major version of OpenAPI to convert obj for
         :rtype: dict
         """
-        return self._convert(
-            obj=obj,
-            context=_Context(
-                convert=self._convert,
-                memo={},
-                schema=obj,
-                openapi_version=openapi_version,
-            ),
+        context = _Context(
+            convert=self._dispatch,
+            memo={},
+            schema=obj,
+            openapi_version=openapi_version,
         )
 
+        # Schemas tend to be converted over and over (e.g. every time the
+        # swagger specification is generated), so we cache their conversions.
+        # Fields and validators are typically created ad hoc, so don't bother.
+        if not isinstance(obj, Schema):
+            return self._dispatch(obj, context)
+
+        partial = obj.partial
+        if m.utils.is_collection(partial):
+            partial = frozenset(cast(Iterable[str], partial))
+        key = (openapi_version, obj.many, partial, obj.unknown)
+
+        conversions = self._schema_cache.get(obj)
+        if conversions is None:
+            conversions = {}
+            self._schema_cache.set(obj, conversions)
+
+        # Callers are free to mutate what we return, so hand out copies
+        if key in conversions:
+            return copy.deepcopy(conversions[key])
+
+        converted = self._dispatch(obj, context)
+        try:
+            conversions[key] = copy.deepcopy(converted)
+        except (TypeError, copy.Error):
+            # Some values (e.g. OneOf choices or defaults) can't be copied,
+            # in which case the schema is converted anew every time.
+            pass
+        return converted
+
+
+# Maps enum classes to the swagger type of their values, without keeping
+# enums defined at runtime (e.g. in tests) alive
+_enum_value_types: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_enum_value_type(enum: type) -> str:
+    """
+    Gets the swagger type of the values of an enum.
+
+    :param type enum:
+    :rtype: str
+    """
+    try:
+        return _enum_value_types[enum]
+    except KeyError:
+        pass
+
+    # I'm going out on a limb and assuming your enum uses same type for all vals, else caveat emptor:
+    value_type = type(next(iter(enum)).value)  # type: ignore
+    if value_type is int:
+        swagger_type = sw.integer
+    elif value_type is float:
+        swagger_type = sw.number
+    else:
+        swagger_type = sw.string
+
+    _enum_value_types[enum] = swagger_type
+    return swagger_type
+
 
+@_register_converter
 class EnumConverter(FieldConverter):
     MARSHMALLOW_TYPE = EnumField  # type: ignore
     # Note that `obj` is typed as Any in this converter because mypy has great difficulty
     # trying to sort out type hints for EnumField, since it could be either m.fields.Enum
     # (marshmallow >= 3.18) or marshmallow_enum.EnumField
 
+    @staticmethod
+    def _is_by_value(obj: Any) -> bool:
+        # Note: we don't (yet?) support mix-and-match between load_by and dump_by. Pick one.
+        return bool(
+            obj.by_value
+            or (
+                LoadDumpOptions is not None
+                and obj.load_by == obj.dump_by == LoadDumpOptions.value
+            )
+        )
+
     @sets_swagger_attr(sw.type_)
     def get_type(self, obj: Any, context: _Context) -> Union[str, List[str]]:
-        # Note: we don't (yet?) support mix-and-match between load_by and dump_by. Pick one.
-        if obj.by_value or (
-            LoadDumpOptions is not None
-            and obj.load_by == obj.dump_by == LoadDumpOptions.value
-        ):
-            # I'm going out on a limb and assuming your enum uses same type for all vals, else caveat emptor:
-            value_type = type(next(iter(obj.enum)).value)
-            if value_type is int:
-                return self.null_type_determination(obj, context, sw.integer)
-            elif value_type is float:
-                return self.null_type_determination(obj, context, sw.number)
-            else:
-                return self.null_type_determination(obj, context, sw.string)
+        if self._is_by_value(obj):
+            return self.null_type_determination(
+                obj, context, _get_enum_value_type(obj.enum)
+            )
         else:
             return self.null_type_determination(obj, context, sw.string)
 
     @sets_swagger_attr(sw.enum)
     def get_enum(self, obj: Any, context: _Context) -> List[str]:
-        if obj.by_value or (
-            LoadDumpOptions is not None
-            and obj.load_by == obj.dump_by == LoadDumpOptions.value
-        ):
+        if self._is_by_value(obj):
             return [entry.value for entry in obj.enum]
         else:
             return [entry.name for entry in obj.enum]
 
 
-ALL_CONVERTERS = tuple(
-    [
-        klass()
-        for _, klass in inspect.getmembers(sys.modules[__name__], inspect.isclass)
-        if issubclass(klass, MarshmallowConverter)
-    ]
-)
+ALL_CONVERTERS = tuple(klass() for klass in _ALL_CONVERTERS)
+
+# Converters don't hold any state, so the registries below share these instances
+_CONVERTER_INSTANCES: Dict[Type[MarshmallowConverter], MarshmallowConverter] = {
+    type(converter): converter for converter in ALL_CONVERTERS
+}
 
 
 def _common_converters() -> List[MarshmallowConverter]:
-    """Instantiates the converters we use in ALL of the registries below"""
-    converters: List[MarshmallowConverter] = [
-        BooleanConverter(),
-        DateConverter(),
-        DateTimeConverter(),
-        FunctionConverter(),
-        IntegerConverter(),
-        LengthConverter(),
-        ListConverter(),
-        MethodConverter(),
-        NumberConverter(),
-        OneOfConverter(),
-        RangeConverter(),
-        SchemaConverter(),
-        StringConverter(),
-        UUIDConverter(),
-        ConstantConverter(),
+    """Gets the converters we use in ALL of the registries below"""
+    converter_types: List[Type[MarshmallowConverter]] = [
+        BooleanConverter,
+        DateConverter,
+        DateTimeConverter,
+        FunctionConverter,
+        IntegerConverter,
+        LengthConverter,
+        ListConverter,
+        MethodConverter,
+        NumberConverter,
+        OneOfConverter,
+        RangeConverter,
+        SchemaConverter,
+        StringConverter,
+        UUIDConverter,
+        ConstantConverter,
     ]
     if EnumConverter.MARSHMALLOW_TYPE is not None:  # type: ignore
-        converters.append(EnumConverter())
+        converter_types.append(EnumConverter)
 
-    return converters
+    return [_CONVERTER_INSTANCES[klass] for klass in converter_types]
 
 
 query_string_converter_registry: ConverterRegistry = ConverterRegistry()
 query_string_converter_registry.register_types(
-    _common_converters() + [CsvArrayConverter(), MultiArrayConverter()]
+    _common_converters()
+    + [
+        _CONVERTER_INSTANCES[CsvArrayConverter],
+        _CONVERTER_INSTANCES[MultiArrayConverter],
+    ]
 )
 
 headers_converter_registry: ConverterRegistry = ConverterRegistry()
 headers_converter_registry.register_types(
-    _common_converters() + [CsvArrayConverter(), MultiArrayConverter()]
+    _common_converters()
+    + [
+        _CONVERTER_INSTANCES[CsvArrayConverter],
+        _CONVERTER_INSTANCES[MultiArrayConverter],
+    ]
 )
 
 request_body_converter_registry: ConverterRegistry = ConverterRegistry()
 request_body_converter_registry.register_types(
-    _common_converters() + [DictConverter(), NestedConverter()]
+    _common_converters()
+    + [_CONVERTER_INSTANCES[DictConverter], _CONVERTER_INSTANCES[NestedConverter]]
 )
 
 response_converter_registry: ConverterRegistry = ConverterRegistry()
 response_converter_registry.register_types(
-    _common_converters() + [DictConverter(), NestedConverter()]
+    _common_converters()
+    + [_CONVERTER_INSTANCES[DictConverter], _CONVERTER_INSTANCES[NestedConverter]]
 )
@@ -10,49 +10,42 @@
 from __future__ import annotations
 import functools
 import warnings
-from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing_extensions import ParamSpec
 
-from werkzeug.local import LocalProxy as module_property  # noqa
-
-
-# ref http://jtushman.github.io/blog/2014/05/02/module-properties/ for background on
-# use of werkzeug LocalProxy to simulate "module properties"
-# end result: singleton config can be accessed by, e.g.,
-#    from flask_rebar.utils.deprecation import config as deprecation_config
-#    deprecation_config.warning_type = YourFavoriteWarning
-
-
 T = TypeVar("T")
 P = ParamSpec("P")
 
 
 class DeprecationConfig:
     """
-    Singleton class to allow one-time set of deprecation config controls
+    Deprecation config controls, shared through the module-level `config` instance, e.g.:
+        from flask_rebar.utils.deprecation import config as deprecation_config
+        deprecation_config.warning_type = YourFavoriteWarning
     """
 
-    __instance = None
+    __slots__ = ("warning_type",)
 
     @staticmethod
     def getInstance() -> DeprecationConfig:
         """Static access method."""
-        if DeprecationConfig.__instance is None:
-            return DeprecationConfig()
-        return DeprecationConfig.__instance
+        return config
 
     def __init__(self) -> None:
-        """Virtually private constructor."""
-        if DeprecationConfig.__instance is not None:
-            raise Exception("This class is a singleton!")
-        else:
-            DeprecationConfig.__instance = self
-            self.warning_type = FutureWarning
+        self.warning_type: Type[Warning] = FutureWarning
 
 
-@module_property
-def config() -> DeprecationConfig:
-    return DeprecationConfig.getInstance()
+config = DeprecationConfig()
 
 
 def deprecated(
@@ -70,11 +63,13 @@ def deprecated(
     found in the tuple; caveat emptor
     """
 
+    # new_func is fixed at decoration time, so parse it once rather than on every call
+    new, eol, _ = _validated_deprecation_spec(new_func)
+    eol = eol_version or eol
+
     def decorator(f: Callable[P, T]) -> Callable[P, T]:
         @functools.wraps(f)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            new, eol, _ = _validated_deprecation_spec(new_func)
-            eol = eol_version or eol
             _deprecation_warning(f.__name__, new, eol, stacklevel=3)
             return f(*args, **kwargs)
 
@@ -93,10 +88,19 @@ def deprecated_parameters(**aliases: Any) -> Callable:
     :return: function decorator that will apply aliases to param names and raise DeprecationWarning
     """
 
+    # likewise, parse the alias specs once rather than on every call
+    alias_specs = {
+        alias: _validated_deprecation_spec(spec) for alias, spec in aliases.items()
+    }
+    alias_names = frozenset(alias_specs)
+
     def decorator(f: Callable[P, T]) -> Callable[P, T]:
         @functools.wraps(f)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            new_kwargs = _remap_kwargs(f.__name__, kwargs, aliases)
+            # Most callers don't use any deprecated names, so skip remapping for them
+            if alias_names.isdisjoint(kwargs):
+                return f(*args, **kwargs)
+            new_kwargs = _remap_kwargs(f.__name__, kwargs, alias_specs)
             return f(*args, **new_kwargs)
 
         return wrapper
@@ -126,29 +130,39 @@ def _validated_deprecation_spec(
     new_name = None
     eol_version = None
     coerce_func = None
-    if type(spec) is tuple:
-        if len(spec) > 0:
-            new_name = str(spec[0]) if spec[0] else None
-        if len(spec) > 1:
-            eol_version = str(spec[1]) if spec[1] else None
-        if len(spec) > 2:
+    if isinstance(spec, tuple):
+        spec_len = len(spec)
+        if spec_len > 0:
+            new_name = _optional_str(spec[0])
+        if spec_len > 1:
+            eol_version = _optional_str(spec[1])
+        if spec_len > 2:
             coerce_func = spec[2]
     elif spec:
-        new_name = str(spec)
+        new_name = _optional_str(spec)
     validated = DeprecationSpec(new_name, eol_version, coerce_func)
     return validated
 
 
+def _optional_str(value: Any) -> Optional[str]:
+    """
+    Coerces a (possibly falsy) value from a deprecation spec to a string or None,
+    without casting values that are strings already.
+    """
+    if not value:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
 def _remap_kwargs(
-    func_name: str, kwargs: Dict[str, Any], aliases: Dict[str, str]
+    func_name: str, kwargs: Dict[str, Any], aliases: Dict[str, DeprecationSpec]
 ) -> Dict[str, Any]:
     """
     Adapted from https://stackoverflow.com/a/49802489/977046
     """
     remapped_args = dict(kwargs)
-    for alias, new_spec in aliases.items():
+    for alias, (new, eol_version, coerce_func) in aliases.items():
         if alias in remapped_args:
-            new, eol_version, coerce_func = _validated_deprecation_spec(new_spec)
             if new in remapped_args:
                 raise TypeError(f"{func_name} received both {alias} and {new}")
             else:
@@ -170,4 +184,4 @@ def _deprecation_warning(
     eol_clause = f" and may be removed in version {eol_version}" if eol_version else ""
     replacement_clause = f"; use {new_name}" if new_name else ""
     msg = f"{old_name} is deprecated{eol_clause}{replacement_clause}"
-    warnings.warn(message=msg, category=config.warning_type, stacklevel=stacklevel)  # type: ignore
+    warnings.warn(message=msg, category=config.warning_type, stacklevel=stacklevel)
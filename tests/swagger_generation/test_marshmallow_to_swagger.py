@@ -8,7 +8,10 @@
     :license: MIT, see LICENSE for details.
 """
 import enum
-from unittest import TestCase
+import gc
+import threading
+import weakref
+from unittest import mock, TestCase
 from parametrize import parametrize
 import pytest
 
@@ -19,6 +22,13 @@ from marshmallow import validate as v
 from flask_rebar.swagger_generation.marshmallow_to_swagger import ALL_CONVERTERS
 from flask_rebar.swagger_generation.marshmallow_to_swagger import ConverterRegistry
 from flask_rebar.swagger_generation.marshmallow_to_swagger import EnumField
+from flask_rebar.swagger_generation.marshmallow_to_swagger import get_schema_fields
+from flask_rebar.swagger_generation.marshmallow_to_swagger import sets_swagger_attr
+from flask_rebar.swagger_generation.marshmallow_to_swagger import sets_swagger_attrs
+from flask_rebar.swagger_generation.marshmallow_to_swagger import StringConverter
+from flask_rebar.swagger_generation.marshmallow_to_swagger import ValidatorConverter
+from flask_rebar.swagger_generation import marshmallow_to_swagger
+from flask_rebar.swagger_generation import swagger_words as sw
 
 from flask_rebar.validation import CommaSeparatedList
 from flask_rebar.validation import QueryParamList
@@ -266,6 +276,7 @@ class TestConverterRegistry(TestCase):
                 "required": ["b", "a"],
             },
         )
+        self.assertEqual(list(json_schema["properties"]), ["b", "a", "c"])
 
     def test_partial(self):
         class Foo(m.Schema):
@@ -560,6 +571,241 @@ class TestConverterRegistry(TestCase):
             },
         )
 
+    def test_schema_conversions_are_cached_by_conversion_parameters(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer(required=True)
+
+        schema = Foo()
+        json_schema = self.registry.convert(schema)
+        json_schema["properties"]["a"]["type"] = "mutated"
+
+        self.assertEqual(
+            self.registry.convert(schema),
+            {
+                "type": "object",
+                "title": "Foo",
+                "properties": {"a": {"type": "integer"}},
+                "required": ["a"],
+                "additionalProperties": False,
+            },
+        )
+
+        schema.partial = True
+        self.assertNotIn("required", self.registry.convert(schema))
+
+    def test_many_schema_conversion_is_cached_separately(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+
+        schema = Foo()
+        self.assertEqual(self.registry.convert(schema)["type"], "object")
+
+        schema.many = True
+        json_schema = self.registry.convert(schema)
+        self.assertEqual(json_schema["type"], "array")
+        self.assertEqual(json_schema["items"]["properties"], {"a": {"type": "integer"}})
+
+    def test_many_schema_reuses_cached_fields(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+
+        schema = Foo(many=True)
+        with mock.patch.object(
+            marshmallow_to_swagger,
+            "_collect_schema_fields",
+            wraps=marshmallow_to_swagger._collect_schema_fields,
+        ) as collect_schema_fields:
+            self.registry.convert(schema)
+            self.registry.convert(schema, openapi_version=3)
+
+        collect_schema_fields.assert_called_once_with(schema)
+
+    def test_unhashable_schema_conversion(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+
+            def __eq__(self, other):
+                return type(self) is type(other)
+
+        self.assertEqual(
+            self.registry.convert(Foo())["properties"], {"a": {"type": "integer"}}
+        )
+
+    def test_equal_schemas_are_converted_separately(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer(required=True)
+            b = m.fields.Integer(required=True)
+
+            def __eq__(self, other):
+                return type(self) is type(other)
+
+            def __hash__(self):
+                return hash(type(self))
+
+        self.registry.convert(Foo())
+        json_schema = self.registry.convert(Foo(only=("a",)))
+
+        self.assertEqual(json_schema["properties"], {"a": {"type": "integer"}})
+        self.assertEqual(json_schema["required"], ["a"])
+
+    def test_uncopyable_schema_conversion(self):
+        lock = threading.Lock()
+
+        class Foo(m.Schema):
+            a = m.fields.Raw(load_default=lock)
+
+        schema = Foo()
+        for _ in range(2):
+            self.assertIs(
+                self.registry.convert(schema)["properties"]["a"]["default"], lock
+            )
+
+    def test_length_attribute_order(self):
+        # Dicts compare equal regardless of order, but the order shows up in
+        # the generated swagger JSON, so make sure it doesn't change.
+        for field, attrs in [
+            (
+                m.fields.String(validate=v.Length(min=1, max=9)),
+                ["type", "maxLength", "minLength"],
+            ),
+            (
+                m.fields.List(m.fields.Integer(), validate=v.Length(min=1, max=9)),
+                ["items", "type", "maxItems", "minItems"],
+            ),
+        ]:
+            with self.subTest(field=field):
+                self.assertEqual(list(self.registry.convert(field)), attrs)
+
+    def test_custom_converter_setting_multiple_attrs(self):
+        class Between(v.Validator):
+            def __init__(self, low, high):
+                self.low = low
+                self.high = high
+
+            def __call__(self, value):
+                return value
+
+        class BetweenConverter(ValidatorConverter):
+            MARSHMALLOW_TYPE = Between
+
+            @sets_swagger_attrs(sw.minimum, sw.maximum)
+            def get_bounds(self, obj, context):
+                return {sw.minimum: obj.low, sw.maximum: obj.high}
+
+        self.registry.register_type(BetweenConverter())
+
+        json_schema = self.registry.convert(m.fields.Integer(validate=Between(1, 9)))
+
+        self.assertEqual(json_schema, {"type": "integer", "minimum": 1, "maximum": 9})
+
+    def test_custom_converter_setting_undeclared_attr(self):
+        class Between(v.Validator):
+            def __call__(self, value):
+                return value
+
+        class BetweenConverter(ValidatorConverter):
+            MARSHMALLOW_TYPE = Between
+
+            @sets_swagger_attrs(sw.minimum, sw.maximum)
+            def get_bounds(self, obj, context):
+                return {sw.minimum: 1, sw.pattern: "[0-9]"}
+
+        self.registry.register_type(BetweenConverter())
+
+        with self.assertRaises(ValueError):
+            self.registry.convert(m.fields.Integer(validate=Between()))
+
+    def test_mutating_schema_fields_does_not_affect_conversion(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+            b = m.fields.Integer()
+
+        schema = Foo()
+        get_schema_fields(schema).pop()
+
+        self.assertEqual(set(self.registry.convert(schema)["properties"]), {"a", "b"})
+
+    def test_schema_fields_of_equal_schemas(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+            b = m.fields.Integer()
+
+            def __eq__(self, other):
+                return type(self) is type(other)
+
+            def __hash__(self):
+                return hash(type(self))
+
+        self.assertEqual([name for name, _ in get_schema_fields(Foo())], ["a", "b"])
+        self.assertEqual(
+            [name for name, _ in get_schema_fields(Foo(only=("a",)))], ["a"]
+        )
+
+    def test_schema_fields_cache_does_not_keep_schemas_alive(self):
+        class Foo(m.Schema):
+            a = m.fields.Integer()
+
+        schema = Foo()
+        get_schema_fields(schema)
+        schema_ref = weakref.ref(schema)
+
+        del schema
+        gc.collect()
+
+        self.assertIsNone(schema_ref())
+
+    def test_register_type_after_convert(self):
+        class CustomString(m.fields.String):
+            pass
+
+        class CustomStringConverter(StringConverter):
+            MARSHMALLOW_TYPE = CustomString
+
+            @sets_swagger_attr(sw.format_)
+            def get_format(self, obj, context):
+                return sw.byte
+
+        self.assertEqual(self.registry.convert(CustomString()), {"type": "string"})
+
+        self.registry.register_type(CustomStringConverter())
+
+        self.assertEqual(
+            self.registry.convert(CustomString()), {"type": "string", "format": "byte"}
+        )
+
+    def test_custom_converter_subclass(self):
+        class CustomString(m.fields.String):
+            pass
+
+        class CustomStringConverter(StringConverter):
+            MARSHMALLOW_TYPE = CustomString
+
+            @sets_swagger_attr(sw.format_)
+            def get_format(self, obj, context):
+                return sw.byte
+
+            # overriding a setter without marking it should drop the attribute
+            def get_description(self, obj, context):
+                return "ignored"
+
+        self.registry.register_type(CustomStringConverter())
+
+        json_schema = self.registry.convert(
+            CustomString(metadata={"description": "blam!"})
+        )
+
+        self.assertEqual(json_schema, {"type": "string", "format": "byte"})
+
+    def test_converters_follow_mro_with_multiple_inheritance(self):
+        class StringFirst(m.fields.String, m.fields.Integer):
+            pass
+
+        class EmailFirst(m.fields.Email, m.fields.Float):
+            pass
+
+        self.assertEqual(self.registry.convert(StringFirst()), {"type": "string"})
+        self.assertEqual(self.registry.convert(EmailFirst()), {"type": "string"})
+
     class FooDefault(m.Schema):  # default in marshmallow 3 will raise
         a = m.fields.Integer()
 
@@ -10,6 +10,7 @@
 import unittest
 import warnings
 from flask_rebar.utils.deprecation import deprecated, deprecated_parameters
+from flask_rebar.utils.deprecation import DeprecationSpec
 from flask_rebar.utils.deprecation import config as deprecation_config
 
 
@@ -45,6 +46,11 @@ def _add(
     )
 
 
+@deprecated_parameters(old_param=DeprecationSpec("new_param", "v99", None))
+def _add_with_spec(new_param=0):
+    return new_param
+
+
 @deprecated()
 def _deprecated_func1():
     return 1
@@ -60,6 +66,11 @@ def _deprecated_func3():
     return 3
 
 
+@deprecated(DeprecationSpec("new_func4", "99", None))
+def _deprecated_func4():
+    return 4
+
+
 class TestParameterDeprecation(unittest.TestCase):
     def test_parameter_deprecation_none(self):
         """Function with deprecated params, called with new (or no) names used does not warn"""
@@ -161,6 +172,19 @@ class TestParameterDeprecation(unittest.TestCase):
             self.assertIn("v99.5", msg)
             self.assertNotIn("new_param", msg)
 
+    def test_parameter_deprecation_spec(self):
+        """Deprecation specs may be given as a DeprecationSpec"""
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = _add_with_spec(old_param=3)
+            self.assertEqual(result, 3)
+            self.assertEqual(len(w), 1)
+            self.assertEqual(
+                str(w[0].message),
+                "old_param is deprecated and may be removed in version v99; "
+                "use new_param",
+            )
+
     def test_parameter_deprecation_warning_type(self):
         """Deprecation supports specifying type of warning"""
         deprecation_config.warning_type = DeprecationWarning
@@ -205,3 +229,16 @@ class TestFunctionDeprecation(unittest.TestCase):
             self.assertIn("_deprecated_func3 is deprecated", str(w[0].message))
             self.assertIn("use new_func3", str(w[0].message))
             self.assertIn("version 99", str(w[0].message))
+
+    def test_deprecation_spec_replacement(self):
+        """Deprecate function with alternative and version given as a DeprecationSpec"""
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = _deprecated_func4()
+            self.assertEqual(result, 4)
+            self.assertEqual(len(w), 1)
+            self.assertEqual(
+                str(w[0].message),
+                "_deprecated_func4 is deprecated and may be removed in version 99; "
+                "use new_func4",
+            )